@@ -21,4 +21,8 @@ export AWX_CREDENTIAL_ID="1"
 export AWX_EXECUTION_ENVIRONMENT_ID=""
 
 # SSL Verification (set to 'false' for self-signed certs)
-export AWX_VERIFY_SSL="true"
\ No newline at end of file
+export AWX_VERIFY_SSL="true"
+
+# Batching for template creation (optional - lower if AWX returns 502/503/504)
+export AWX_ASYNC_CONCURRENCY="20"
+export AWX_BATCH_DELAY="2"
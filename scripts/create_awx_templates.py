@@ -7,6 +7,8 @@ playbook, and creates corresponding job templates in AWX via the REST API.
 
 Requirements:
     pip install requests pyyaml
+    pip install orjson  # Optional, faster JSON handling
+    pip install ijson  # Optional, streamed decoding of large template listings
 
 Configuration:
     Set environment variables or update the CONFIG dictionary:
@@ -15,16 +17,70 @@ Configuration:
     - AWX_PROJECT_ID: Project ID containing these playbooks
     - AWX_INVENTORY_ID: Inventory ID to use for job templates
     - AWX_CREDENTIAL_ID: Credential ID for authentication
+    - AWX_ASYNC_CONCURRENCY: Playbooks processed per batch (default: 20)
+    - AWX_BATCH_DELAY: Seconds to wait between batches (default: 2)
 """
 
 import os
 import sys
 import json
+import mmap
+import multiprocessing
+import threading
 import yaml
+import time
 import requests
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from requests.adapters import HTTPAdapter
+from typing import Callable, Dict, List, Any, Optional, Tuple
 from urllib.parse import urljoin
+from urllib3.util.retry import Retry
+
+# Prefer orjson for (de)serializing API payloads when available
+try:
+    import orjson
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+# ijson is optional; without it job template listings are decoded in full
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Prefer the libyaml C bindings when available
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+
+# Fields kept for cached job templates, and the response size (bytes) below
+# which a listing is decoded in one go rather than streamed. The size is
+# compared against Content-Length, i.e. the on-the-wire size: when AWX gzips
+# responses, pages several times this size decoded still take the in-memory path.
+_TEMPLATE_FIELDS = frozenset(['id', 'name', 'survey_enabled'])
+_STREAM_THRESHOLD = 64 * 1024
+
+# Common playbook variables to expose as extra_vars
+_VAR_KEYS = frozenset([
+    'k3s_context',
+    'esphome_namespace',
+    'esphome_deployment_name',
+    'esphome_timeout',
+    'esphome_no_logs',
+])
+
+# Below this many playbooks, parsing inline beats starting a process pool
+_PARSE_POOL_THRESHOLD = 16
+
+# Playbook variables with this suffix are listed in template descriptions
+_PATTERN_SUFFIX = '_patterns'
 
 # Configuration - can be overridden with environment variables
 CONFIG = {
@@ -36,6 +92,8 @@ CONFIG = {
     'execution_environment_id': os.getenv('AWX_EXECUTION_ENVIRONMENT_ID', ''),
     'playbook_dir': 'playbooks/esphome',
     'verify_ssl': os.getenv('AWX_VERIFY_SSL', 'true').lower() == 'true',
+    'awx_async_concurrency': os.getenv('AWX_ASYNC_CONCURRENCY') or '20',
+    'awx_batch_delay': os.getenv('AWX_BATCH_DELAY') or '2',
 }
 
 
@@ -50,78 +108,256 @@ class AWXTemplateManager:
             'Content-Type': 'application/json',
         })
         self.session.verify = config['verify_ssl']
+
+        # Size the connection pool for concurrent use and retry transient
+        # gateway errors AWX returns when its workers are saturated. Only
+        # idempotent methods are retried on a response status; a 504 may mean
+        # a POST was applied, so POST is only retried on connection errors.
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=5,
+                backoff_factor=0.3,
+                status_forcelist=(502, 503, 504),
+                allowed_methods=frozenset(['GET', 'PATCH']),
+            ),
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         self.base_url = config['awx_url'].rstrip('/')
 
-    def _api_call(self, method: str, endpoint: str, **kwargs) -> requests.Response:
-        """Make an API call to AWX."""
+        # Job templates looked up by name during this run. Once seeded from
+        # list_all_templates() the cache is complete and misses mean absent.
+        self._template_cache: Dict[str, Optional[Dict[str, Any]]] = {}
+        self._template_cache_complete = False
+
+        # Per-name locks so concurrent playbooks that map to the same
+        # template don't both see it as absent and both create it
+        self._name_locks: Dict[str, threading.Lock] = {}
+        self._name_locks_guard = threading.Lock()
+
+    def _api_call(self, method: str, endpoint: str, log: Callable[[str], None] = print,
+                  **kwargs) -> requests.Response:
+        """Make an API call to AWX, reporting error details through log."""
         url = urljoin(f"{self.base_url}/api/v2/", endpoint.lstrip('/'))
+        if 'json' in kwargs:
+            # Serialize ourselves; the session already sends Content-Type: application/json
+            kwargs['data'] = _dumps(kwargs.pop('json'))
         response = self.session.request(method, url, **kwargs)
         try:
             response.raise_for_status()
         except requests.exceptions.HTTPError as e:
             # Print detailed error info for debugging
             try:
-                error_detail = response.json()
-                print(f"  API Error Details: {error_detail}")
+                error_detail = _loads(response.content)
+                log(f"  API Error Details: {error_detail}")
             except:
-                print(f"  API Error: {response.text}")
+                log(f"  API Error: {response.text}")
             raise
         return response
 
-    def get_template(self, name: str) -> Optional[Dict[str, Any]]:
+    def _list_job_templates(self, params: Dict[str, Any],
+                            log: Callable[[str], None] = print) -> Tuple[List[Dict[str, Any]], bool]:
+        """Fetch one page of job templates, returning (templates, has_next).
+
+        Templates are projected to _TEMPLATE_FIELDS. Large pages are streamed
+        through ijson so discarded fields are never materialized.
+        """
+        response = self._api_call('GET', '/job_templates/', log, params=params, stream=True)
+        try:
+            length = int(response.headers.get('Content-Length') or 0)
+            if ijson is None or 0 < length < _STREAM_THRESHOLD:
+                data = _loads(response.content)
+                templates = [
+                    {k: v for k, v in item.items() if k in _TEMPLATE_FIELDS}
+                    for item in data.get('results', [])
+                ]
+                return templates, bool(data.get('next'))
+
+            response.raw.decode_content = True
+            templates, has_next, current = [], False, None
+            for prefix, event, value in ijson.parse(response.raw):
+                if prefix == 'next':
+                    has_next = value is not None
+                elif prefix == 'results.item':
+                    if event == 'start_map':
+                        current = {}
+                    elif event == 'end_map':
+                        templates.append(current)
+                elif prefix.startswith('results.item.'):
+                    field = prefix[len('results.item.'):]
+                    if field in _TEMPLATE_FIELDS:
+                        current[field] = value
+            return templates, has_next
+        finally:
+            response.close()
+
+    def get_template(self, name: str, log: Callable[[str], None] = print) -> Optional[Dict[str, Any]]:
         """Check if a job template already exists."""
+        if name in self._template_cache or self._template_cache_complete:
+            return self._template_cache.get(name)
+
         try:
-            response = self._api_call('GET', '/job_templates/', params={'name': name})
-            results = response.json().get('results', [])
-            return results[0] if results else None
+            results, _ = self._list_job_templates({'name': name}, log)
+            self._template_cache[name] = results[0] if results else None
+            return self._template_cache[name]
         except requests.exceptions.RequestException as e:
-            print(f"Error checking for existing template: {e}")
+            log(f"Error checking for existing template: {e}")
             return None
 
-    def create_template(self, template_data: Dict[str, Any]) -> Dict[str, Any]:
+    def list_all_templates(self, page_size: int = 200) -> Dict[str, Dict[str, Any]]:
+        """Fetch every job template in as few paginated requests as possible.
+
+        Seeds the template cache so later lookups by name need no API call.
+        """
+        templates = {}
+        page = 1
+        while True:
+            results, has_next = self._list_job_templates({'page_size': page_size, 'page': page})
+            for template in results:
+                templates[template['name']] = template
+            if not has_next:
+                break
+            page += 1
+
+        self._template_cache.update(templates)
+        self._template_cache_complete = True
+        return templates
+
+    def create_template(self, template_data: Dict[str, Any],
+                        log: Callable[[str], None] = print) -> Dict[str, Any]:
         """Create a new job template."""
-        response = self._api_call('POST', '/job_templates/', json=template_data)
-        return response.json()
+        response = self._api_call('POST', '/job_templates/', log, json=template_data)
+        result = _loads(response.content)
+        self._cache_template(template_data['name'], result)
+        return result
 
-    def update_template(self, template_id: int, template_data: Dict[str, Any]) -> Dict[str, Any]:
+    def update_template(self, template_id: int, template_data: Dict[str, Any],
+                        log: Callable[[str], None] = print) -> Dict[str, Any]:
         """Update an existing job template."""
-        response = self._api_call('PATCH', f'/job_templates/{template_id}/', json=template_data)
-        return response.json()
-
-    def create_or_update_template(self, template_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Create or update a job template."""
-        existing = self.get_template(template_data['name'])
+        response = self._api_call('PATCH', f'/job_templates/{template_id}/', log, json=template_data)
+        result = _loads(response.content)
+        self._cache_template(template_data.get('name', result.get('name')), result)
+        return result
 
-        # Extract credentials to add separately
-        credentials = template_data.pop('credentials', None)
+    def _cache_template(self, name: str, template: Dict[str, Any]):
+        """Replace a cached template with the result of a successful mutation,
+        projected to _TEMPLATE_FIELDS like templates read from listings."""
+        self._template_cache.pop(name, None)
+        self._template_cache[template.get('name', name)] = {
+            k: v for k, v in template.items() if k in _TEMPLATE_FIELDS
+        }
 
-        if existing:
-            print(f"Updating existing template: {template_data['name']}")
-            result = self.update_template(existing['id'], template_data)
-            template_id = existing['id']
+    def create_or_update_template(self, template_data: Dict[str, Any],
+                                  log: Callable[[str], None] = print) -> Tuple[Dict[str, Any], str]:
+        """Create or update a job template.
+
+        Returns the API result and the action taken ('created' or 'updated').
+        Progress messages go through log so concurrent callers can buffer them.
+        """
+        with self._name_lock(template_data['name']):
+            existing = self.get_template(template_data['name'], log)
+
+            # Extract credentials to add separately
+            credentials = template_data.pop('credentials', None)
+
+            if existing:
+                log(f"  Updating existing template: {template_data['name']}")
+                result = self.update_template(existing['id'], template_data, log)
+                template_id = existing['id']
+                action = 'updated'
+            else:
+                log(f"  Creating new template: {template_data['name']}")
+                result = self.create_template(template_data, log)
+                template_id = result['id']
+                action = 'created'
+
+            # Associate credentials if provided
+            if credentials:
+                self.associate_credentials(template_id, credentials, log)
+
+        return result, action
+
+    def _name_lock(self, name: str) -> threading.Lock:
+        """Return the lock serializing work on the template with this name."""
+        with self._name_locks_guard:
+            return self._name_locks.setdefault(name, threading.Lock())
+
+    def associate_credentials(self, template_id: int, credential_ids: list,
+                              log: Callable[[str], None] = print):
+        """Associate credentials with a job template.
+
+        AWX takes one credential per POST. A single credential (the usual
+        case) is posted inline; several are posted concurrently over the
+        shared session rather than one after another.
+        """
+        if not credential_ids:
+            return
+
+        def associate(cred_id: int):
+            self._api_call(
+                'POST',
+                f'/job_templates/{template_id}/credentials/',
+                log,
+                json={'id': cred_id}
+            )
+
+        if len(credential_ids) == 1:
+            cred_id = credential_ids[0]
+            try:
+                associate(cred_id)
+                outcomes = [(cred_id, None)]
+            except Exception as e:
+                outcomes = [(cred_id, e)]
         else:
-            print(f"Creating new template: {template_data['name']}")
-            result = self.create_template(template_data)
-            template_id = result['id']
+            with ThreadPoolExecutor(max_workers=min(8, len(credential_ids))) as executor:
+                futures = {executor.submit(associate, cred_id): cred_id for cred_id in credential_ids}
+                outcomes = [(futures[future], future.exception()) for future in as_completed(futures)]
+
+        for cred_id, error in outcomes:
+            if error:
+                log(f"  Warning: Could not associate credential {cred_id}: {error}")
+            else:
+                log(f"  ✓ Associated credential {cred_id}")
+
+    def wait_for_project_sync(self, project_id: str, timeout: float = 30.0) -> bool:
+        """Poll a project until its last sync succeeds, with exponential backoff.
+
+        The ETag from each response is sent back as If-None-Match, so polls
+        made while nothing has changed come back as an empty 304.
+        """
+        delay = 0.25
+        deadline = time.monotonic() + timeout
+        etag = None
+
+        while time.monotonic() < deadline:
+            time.sleep(delay)
+            delay = min(delay * 1.8, 4.0)
+
+            headers = {'If-None-Match': etag} if etag else {}
+            response = self._api_call('GET', f'/projects/{project_id}/', headers=headers)
+            if response.status_code != 304:
+                etag = response.headers.get('ETag')
+                if _loads(response.content).get('status') == 'successful':
+                    return True
+            print(".", end='', flush=True)
 
-        # Associate credentials if provided
-        if credentials:
-            self.associate_credentials(template_id, credentials)
+        return False
 
-        return result
 
-    def associate_credentials(self, template_id: int, credential_ids: list):
-        """Associate credentials with a job template."""
-        for cred_id in credential_ids:
-            try:
-                self._api_call(
-                    'POST',
-                    f'/job_templates/{template_id}/credentials/',
-                    json={'id': cred_id}
-                )
-                print(f"  ✓ Associated credential {cred_id}")
-            except Exception as e:
-                print(f"  Warning: Could not associate credential {cred_id}: {e}")
+def _load_yaml(path: str) -> Any:
+    """Load a YAML file.
+
+    The file is memory-mapped and handed to the parser as bytes, avoiding a
+    decoded copy of the whole file.
+    """
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            # mmap can't map an empty file
+            return None
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return yaml.load(mm, Loader=SafeLoader)
 
 
 class PlaybookParser:
@@ -130,8 +366,7 @@ class PlaybookParser:
     @staticmethod
     def parse_playbook(filepath: Path) -> Dict[str, Any]:
         """Extract metadata from a playbook file."""
-        with open(filepath, 'r') as f:
-            playbook = yaml.safe_load(f)
+        playbook = _load_yaml(str(filepath))
 
         if not playbook or not isinstance(playbook, list):
             return {}
@@ -156,22 +391,7 @@ class PlaybookParser:
     @staticmethod
     def extract_extra_vars(playbook_vars: Dict[str, Any]) -> Dict[str, Any]:
         """Extract variables that should be exposed as extra_vars."""
-        extra_vars = {}
-
-        # Common variables to expose
-        var_keys = [
-            'k3s_context',
-            'esphome_namespace',
-            'esphome_deployment_name',
-            'esphome_timeout',
-            'esphome_no_logs',
-        ]
-
-        for key in var_keys:
-            if key in playbook_vars:
-                extra_vars[key] = playbook_vars[key]
-
-        return extra_vars
+        return {key: playbook_vars[key] for key in _VAR_KEYS & playbook_vars.keys()}
 
     @staticmethod
     def generate_description(playbook_name: str, playbook_vars: Dict[str, Any]) -> str:
@@ -179,9 +399,8 @@ class PlaybookParser:
         desc_parts = [playbook_name]
 
         # Add device pattern info if available
-        for key in playbook_vars.keys():
-            if key.endswith('_patterns'):
-                patterns = playbook_vars[key]
+        for key, patterns in playbook_vars.items():
+            if key.endswith(_PATTERN_SUFFIX):
                 if isinstance(patterns, list):
                     desc_parts.append(f"Patterns: {', '.join(patterns)}")
 
@@ -203,6 +422,24 @@ def validate_config(config: Dict[str, Any]) -> bool:
         print("  AWX_CREDENTIAL_ID - (Optional) Credential ID")
         return False
 
+    invalid = []
+    try:
+        if int(config['awx_async_concurrency']) < 1:
+            invalid.append('AWX_ASYNC_CONCURRENCY')
+    except ValueError:
+        invalid.append('AWX_ASYNC_CONCURRENCY')
+    try:
+        if float(config['awx_batch_delay']) < 0:
+            invalid.append('AWX_BATCH_DELAY')
+    except ValueError:
+        invalid.append('AWX_BATCH_DELAY')
+
+    if invalid:
+        print(f"Error: Invalid configuration: {', '.join(invalid)}")
+        print("\n  AWX_ASYNC_CONCURRENCY - Positive integer (default: 20)")
+        print("  AWX_BATCH_DELAY - Non-negative number of seconds (default: 2)")
+        return False
+
     return True
 
 
@@ -213,20 +450,24 @@ def scan_playbooks(playbook_dir: str) -> List[Path]:
         print(f"Error: Playbook directory not found: {playbook_dir}")
         sys.exit(1)
 
-    return sorted(playbook_path.glob('*.yaml'))
+    # DirEntry caches file type info, so filtering needs no extra stat calls
+    entries = [
+        Path(entry.path) for entry in os.scandir(playbook_path)
+        if entry.is_file() and entry.name.endswith('.yaml')
+    ]
+    entries.sort(key=lambda p: p.name)
+    return entries
 
 
 def build_template_data(playbook_meta: Dict[str, Any], config: Dict[str, Any]) -> Dict[str, Any]:
     """Build AWX job template data structure."""
-    parser = PlaybookParser()
-
     # Generate template name from playbook name
     template_name = playbook_meta['name']
     if not template_name:
         template_name = Path(playbook_meta['filepath']).stem.replace('_', ' ').title()
 
-    extra_vars = parser.extract_extra_vars(playbook_meta['vars'])
-    description = parser.generate_description(playbook_meta['name'], playbook_meta['vars'])
+    extra_vars = PlaybookParser.extract_extra_vars(playbook_meta['vars'])
+    description = PlaybookParser.generate_description(playbook_meta['name'], playbook_meta['vars'])
 
     template_data = {
         'name': template_name,
@@ -236,7 +477,7 @@ def build_template_data(playbook_meta: Dict[str, Any], config: Dict[str, Any]) -
         'project': int(config['project_id']),
         'playbook': playbook_meta['filepath'],
         'ask_variables_on_launch': True,  # Allow overriding extra_vars
-        'extra_vars': yaml.dump(extra_vars, default_flow_style=False),
+        'extra_vars': yaml.dump(extra_vars, Dumper=SafeDumper, default_flow_style=False),
     }
 
     # Add credential if provided
@@ -254,6 +495,66 @@ def build_template_data(playbook_meta: Dict[str, Any], config: Dict[str, Any]) -
     return template_data
 
 
+def _parse_playbook_safe(filepath: Path) -> Tuple[Dict[str, Any], Optional[str]]:
+    """Parse a playbook, returning (metadata, error) so one bad file can't
+    abort the whole pool."""
+    try:
+        return PlaybookParser.parse_playbook(filepath), None
+    except Exception as e:
+        return {}, str(e)
+
+
+def parse_playbooks(playbooks: List[Path]) -> List[Tuple[Dict[str, Any], Optional[str]]]:
+    """Parse all playbooks, in parallel across CPU cores when there are
+    enough of them to outweigh the cost of starting worker processes."""
+    if len(playbooks) < _PARSE_POOL_THRESHOLD:
+        return [_parse_playbook_safe(path) for path in playbooks]
+
+    processes = min(os.cpu_count() or 1, len(playbooks))
+    with multiprocessing.Pool(processes=processes) as pool:
+        return pool.map(_parse_playbook_safe, playbooks)
+
+
+def process_playbook(playbook_path: Path, parsed: Tuple[Dict[str, Any], Optional[str]],
+                     manager: AWXTemplateManager, config: Dict[str, Any]) -> Tuple[str, str]:
+    """Create or update the job template for a single parsed playbook.
+
+    Returns an (action, name) tuple where action is 'created', 'updated',
+    'skipped' or 'failed'. Output, including the manager's messages, is
+    buffered and printed in one call so concurrent workers don't interleave.
+    """
+    lines = [f"\nProcessing: {playbook_path.name}"]
+    action, name = 'skipped', playbook_path.name
+
+    try:
+        playbook_meta, parse_error = parsed
+        if parse_error:
+            raise ValueError(f"Could not parse playbook: {parse_error}")
+
+        if not playbook_meta.get('name'):
+            lines.append("  Warning: Could not extract name from playbook, skipping")
+        else:
+            # Build template data
+            template_data = build_template_data(playbook_meta, config)
+
+            # Debug: Print playbook path being used
+            lines.append(f"  Using playbook path: {template_data['playbook']}")
+
+            # Create or update template
+            result, template_action = manager.create_or_update_template(template_data, lines.append)
+
+            if result.get('id'):
+                action, name = template_action, template_data['name']
+                lines.append(f"  ✓ Template {action}: {name} (ID: {result['id']})")
+
+    except Exception as e:
+        action = 'failed'
+        lines.append(f"  ✗ Failed: {e}")
+
+    print("\n".join(lines))
+    return action, name
+
+
 def main():
     """Main execution function."""
     print("AWX Job Template Creator for ESPHome Playbooks")
@@ -273,16 +574,9 @@ def main():
         print(f"  ✓ Project sync initiated")
 
         # Wait for sync to complete
-        import time
         print("  Waiting for sync to complete...", end='', flush=True)
-        for i in range(10):
-            time.sleep(2)
-            project_response = manager._api_call('GET', f'/projects/{CONFIG["project_id"]}/')
-            status = project_response.json().get('status')
-            if status == 'successful':
-                print(" Done!")
-                break
-            print(".", end='', flush=True)
+        if manager.wait_for_project_sync(CONFIG['project_id']):
+            print(" Done!")
         else:
             print("\n  Warning: Sync may still be running, continuing anyway...")
     except Exception as e:
@@ -293,38 +587,38 @@ def main():
     playbooks = scan_playbooks(CONFIG['playbook_dir'])
     print(f"\nFound {len(playbooks)} playbook(s) in {CONFIG['playbook_dir']}")
 
-    # Process each playbook
-    results = {'created': [], 'updated': [], 'failed': []}
-
-    for playbook_path in playbooks:
-        print(f"\nProcessing: {playbook_path.name}")
-
-        try:
-            # Parse playbook
-            parser = PlaybookParser()
-            playbook_meta = parser.parse_playbook(playbook_path)
-
-            if not playbook_meta.get('name'):
-                print(f"  Warning: Could not extract name from playbook, skipping")
-                continue
-
-            # Build template data
-            template_data = build_template_data(playbook_meta, CONFIG)
+    # Parse all playbooks before any API calls
+    parsed = list(zip(playbooks, parse_playbooks(playbooks)))
 
-            # Debug: Print playbook path being used
-            print(f"  Using playbook path: {template_data['playbook']}")
-
-            # Create or update template
-            result = manager.create_or_update_template(template_data)
-
-            if result.get('id'):
-                action = 'updated' if manager.get_template(template_data['name']) else 'created'
-                results[action].append(template_data['name'])
-                print(f"  ✓ Template {action}: {template_data['name']} (ID: {result['id']})")
+    # Fetch existing templates up front so per-playbook lookups hit the cache
+    try:
+        existing = manager.list_all_templates()
+        print(f"Found {len(existing)} existing job template(s) in AWX")
+    except Exception as e:
+        print(f"Warning: Could not list existing templates, looking up individually: {e}")
 
-        except Exception as e:
-            results['failed'].append(playbook_path.name)
-            print(f"  ✗ Failed: {e}")
+    # Process playbooks concurrently in batches, pausing between batches so
+    # AWX's uwsgi workers aren't exhausted (which surfaces as 502/503/504)
+    results = {'created': [], 'updated': [], 'failed': []}
+    batch_size = int(CONFIG['awx_async_concurrency'])
+    batch_delay = float(CONFIG['awx_batch_delay'])
+
+    with ThreadPoolExecutor(max_workers=batch_size) as executor:
+        for start in range(0, len(parsed), batch_size):
+            if start:
+                time.sleep(batch_delay)
+
+            batch = parsed[start:start + batch_size]
+            futures = [
+                executor.submit(process_playbook, path, parse_result, manager, CONFIG)
+                for path, parse_result in batch
+            ]
+            wait(futures)
+
+            for future in futures:
+                action, name = future.result()
+                if action in results:
+                    results[action].append(name)
 
     # Print summary
     print("\n" + "=" * 60)
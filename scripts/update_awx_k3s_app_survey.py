@@ -7,6 +7,7 @@ to include a survey question asking which application to update.
 
 Requirements:
     pip install requests pyyaml
+    pip install orjson  # Optional, faster JSON handling
 
 Configuration:
     Set environment variables or update the CONFIG dictionary:
@@ -30,8 +31,27 @@ import json
 import yaml
 import requests
 from pathlib import Path
+from requests.adapters import HTTPAdapter
 from typing import Dict, List, Any, Optional
 from urllib.parse import urljoin
+from urllib3.util.retry import Retry
+
+# Prefer orjson for (de)serializing API payloads when available
+try:
+    import orjson
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+# Prefer the libyaml C bindings when available
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
 
 
 # Configuration - can be overridden with environment variables
@@ -55,18 +75,36 @@ class AWXSurveyManager:
             'Content-Type': 'application/json',
         })
         self.session.verify = config['verify_ssl']
+
+        # Retry transient gateway errors AWX returns when its workers are
+        # saturated. Only idempotent methods are retried on a response status;
+        # a 504 may mean a POST was applied, so POST is only retried on
+        # connection errors.
+        adapter = HTTPAdapter(
+            max_retries=Retry(
+                total=5,
+                backoff_factor=0.3,
+                status_forcelist=(502, 503, 504),
+                allowed_methods=frozenset(['GET', 'PATCH']),
+            ),
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         self.base_url = config['awx_url'].rstrip('/')
 
     def _api_call(self, method: str, endpoint: str, **kwargs) -> requests.Response:
         """Make an API call to AWX."""
         url = urljoin(f"{self.base_url}/api/v2/", endpoint.lstrip('/'))
+        if 'json' in kwargs:
+            # Serialize ourselves; the session already sends Content-Type: application/json
+            kwargs['data'] = _dumps(kwargs.pop('json'))
         response = self.session.request(method, url, **kwargs)
         try:
             response.raise_for_status()
         except requests.exceptions.HTTPError as e:
             # Print detailed error info for debugging
             try:
-                error_detail = response.json()
+                error_detail = _loads(response.content)
                 print(f"API Error Details: {json.dumps(error_detail, indent=2)}")
             except:
                 print(f"API Error: {response.text}")
@@ -77,7 +115,7 @@ class AWXSurveyManager:
         """Get job template details."""
         try:
             response = self._api_call('GET', f'/job_templates/{template_id}/')
-            return response.json()
+            return _loads(response.content)
         except requests.exceptions.RequestException as e:
             print(f"Error getting template: {e}")
             return None
@@ -86,7 +124,7 @@ class AWXSurveyManager:
         """Get current survey for a job template."""
         try:
             response = self._api_call('GET', f'/job_templates/{template_id}/survey_spec/')
-            return response.json()
+            return _loads(response.content)
         except requests.exceptions.RequestException as e:
             # Survey may not exist yet
             return None
@@ -100,7 +138,7 @@ class AWXSurveyManager:
     def enable_survey(self, template_id: int) -> Dict[str, Any]:
         """Enable survey for a job template."""
         response = self._api_call('PATCH', f'/job_templates/{template_id}/', json={'survey_enabled': True})
-        return response.json()
+        return _loads(response.content)
 
 
 def load_k3s_applications(filepath: str) -> Dict[str, Any]:
@@ -111,7 +149,7 @@ def load_k3s_applications(filepath: str) -> Dict[str, Any]:
         sys.exit(1)
 
     with open(app_file, 'r') as f:
-        data = yaml.safe_load(f)
+        data = yaml.load(f, Loader=SafeLoader)
 
     return data.get('k3s_applications', {})
 
@@ -219,10 +257,13 @@ def main():
             raise Exception("Survey update returned non-200 status")
         print("✓ Survey updated successfully")
 
-        # Enable survey on template
-        print("Enabling survey on template...")
-        manager.enable_survey(template_id)
-        print("✓ Survey enabled")
+        # Enable survey on template (skip the round-trip if already enabled)
+        if template.get('survey_enabled'):
+            print("✓ Survey already enabled")
+        else:
+            print("Enabling survey on template...")
+            manager.enable_survey(template_id)
+            print("✓ Survey enabled")
 
         print("\n" + "=" * 60)
         print("Success!")
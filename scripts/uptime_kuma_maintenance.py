@@ -30,10 +30,15 @@ except ImportError:
     traceback.print_exc()
     sys.exit(1)
 
+# Title used to identify maintenance windows created by this script
+ANSIBLE_MAINT_TITLE = "Ansible Maintenance Window"
+
 
 def create_maintenance(api):
     """Create a maintenance window for all monitor groups and status pages."""
-    # Get all groups (monitors within groups inherit maintenance status)
+    # Get all groups (monitors within groups inherit maintenance status).
+    # add_monitor_maintenance/add_status_page_maintenance take [{"id": ...}]
+    # dicts rather than bare ids, so build that shape once in a single pass.
     monitors = api.get_monitors()
     monitor_ids = [{"id": m["id"]} for m in monitors if m.get("type") == "group"]
 
@@ -43,7 +48,7 @@ def create_maintenance(api):
 
     # Create manual maintenance window (stays active until cancelled)
     result = api.add_maintenance(
-        title="Ansible Maintenance Window",
+        title=ANSIBLE_MAINT_TITLE,
         description="Automated maintenance created by Ansible maintenance mode playbook",
         strategy=MaintenanceStrategy.MANUAL,
         active=True
@@ -110,21 +115,24 @@ def report_status(api):
 
 
 def delete_maintenance(api):
-    """Delete all Ansible-created maintenance windows."""
-    maintenances = api.get_maintenances()
-    deleted_count = 0
+    """Delete all Ansible-created maintenance windows.
 
-    for maintenance in maintenances:
-        if maintenance.get("title") == "Ansible Maintenance Window":
-            api.delete_maintenance(maintenance["id"])
-            print(f"Deleted maintenance window: {maintenance['id']}")
-            deleted_count += 1
+    Deletes run one at a time: uptime-kuma-api's delete_maintenance()
+    re-fetches the maintenance list and waits on shared client event state,
+    so overlapping calls on one UptimeKumaApi aren't safe.
+    """
+    maintenances = api.get_maintenances()
+    targets = [m["id"] for m in maintenances if m.get("title") == ANSIBLE_MAINT_TITLE]
 
-    if deleted_count == 0:
+    if not targets:
         print("No Ansible maintenance windows found to delete")
-    else:
-        print(f"Deleted {deleted_count} maintenance window(s)")
+        return True
+
+    for maintenance_id in targets:
+        api.delete_maintenance(maintenance_id)
+        print(f"Deleted maintenance window: {maintenance_id}")
 
+    print(f"Deleted {len(targets)} maintenance window(s)")
     return True
 
 